@@ -0,0 +1,122 @@
+# cli.py - Gộp các script vào 1 entry point
+#
+# Các thư viện nặng (torch, ultralytics, cv2, pandas, matplotlib, yaml) chỉ
+# được import bên trong hàm của từng lệnh con, nên các lệnh chỉ đọc label
+# (kiemtra-label) khởi động ngay mà không phải load torch/ultralytics.
+#
+#   python cli.py kiemtra-label --label-dir /content/test/labels --img-dir /content/test/images
+#   python cli.py xoa-class --yaml /content/data_test.yaml --root /content
+#   python cli.py bieudo --csv /content/runs/yolo_fracture_lowmem2/results.csv
+#   python cli.py train --data /content/data.yaml --model-size n --epochs 110
+#   python cli.py predict anh.jpg --model best.pt --conf 0.4 --iou 0.45
+
+import argparse
+import os
+import sys
+
+
+def cmd_kiemtra_label(args):
+    """Kiểm tra label rỗng và ảnh tương ứng (không cần thư viện nặng)"""
+    from kiemtra_anh_voi_label import check_empty_labels
+
+    check_empty_labels(args.label_dir, args.img_dir, limit=args.limit)
+    return 0
+
+
+def cmd_xoa_class(args):
+    """Chạy pipeline xóa 1 class khỏi dataset"""
+    from kiemtra_xoa_it_anh import SimpleDatasetCleanupPipeline
+
+    if not os.path.exists(args.yaml):
+        print(f"❌ File không tồn tại: {args.yaml}")
+        return 1
+
+    data_dirs = {
+        split: {
+            "labels": os.path.join(args.root, folder, "labels"),
+            "images": os.path.join(args.root, folder, "images"),
+        }
+        for split, folder in [("train", "train"), ("val", "valid"), ("test", "test")]
+    }
+
+    pipeline = SimpleDatasetCleanupPipeline(args.yaml, data_dirs)
+    return 0 if pipeline.run_pipeline() else 1
+
+
+def cmd_bieudo(args):
+    """Vẽ biểu đồ từ results.csv (import pandas + matplotlib)"""
+    from xuat_bieudo import ve_bieudo
+
+    ve_bieudo(args.csv)
+    return 0
+
+
+def cmd_train(args):
+    """Train YOLO (import torch + ultralytics)"""
+    from code_train import train_yolo_lowmem
+
+    train_yolo_lowmem(
+        data_yaml=args.data, model_size=args.model_size, epochs=args.epochs
+    )
+    return 0
+
+
+def cmd_predict(args):
+    """Dự đoán YOLO trên 1 ảnh (import cv2 + ultralytics)"""
+    from run_main import yolo_predict_simple
+
+    yolo_predict_simple(
+        args.image,
+        args.model,
+        conf_threshold=args.conf,
+        iou_threshold=args.iou,
+    )
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Công cụ dataset / train / predict YOLO"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("kiemtra-label", help="Kiểm tra label rỗng và ảnh tương ứng")
+    p.add_argument("--label-dir", default="/content/test/labels")
+    p.add_argument("--img-dir", default="/content/test/images")
+    p.add_argument("--limit", type=int, default=10, help="Số label rỗng cần kiểm tra")
+    p.set_defaults(func=cmd_kiemtra_label)
+
+    p = sub.add_parser("xoa-class", help="Xóa 1 class khỏi dataset + cập nhật YAML")
+    p.add_argument("--yaml", default="/content/data_test.yaml")
+    p.add_argument(
+        "--root", default="/content", help="Thư mục chứa train/, valid/, test/"
+    )
+    p.set_defaults(func=cmd_xoa_class)
+
+    p = sub.add_parser("bieudo", help="Vẽ biểu đồ loss / mAP từ results.csv")
+    p.add_argument("--csv", default="/content/runs/yolo_fracture_lowmem2/results.csv")
+    p.set_defaults(func=cmd_bieudo)
+
+    p = sub.add_parser("train", help="Train YOLO (low memory)")
+    p.add_argument("--data", default="/content/data.yaml")
+    p.add_argument("--model-size", default="n")
+    p.add_argument("--epochs", type=int, default=110)
+    p.set_defaults(func=cmd_train)
+
+    p = sub.add_parser("predict", help="Dự đoán YOLO trên 1 ảnh")
+    p.add_argument("image")
+    p.add_argument("--model", required=True)
+    p.add_argument("--conf", type=float, default=0.4)
+    p.add_argument("--iou", type=float, default=0.45)
+    p.set_defaults(func=cmd_predict)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
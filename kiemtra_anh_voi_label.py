@@ -3,11 +3,13 @@
 from pathlib import Path
 
 
-def check_empty_labels():
+def check_empty_labels(
+    label_dir="/content/test/labels", img_dir="/content/test/images", limit=10
+):
     """Kiểm tra xem ảnh empty có tồn tại không"""
 
-    label_dir = Path("/content/test/labels")
-    img_dir = Path("/content/test/images")
+    label_dir = Path(label_dir)
+    img_dir = Path(img_dir)
 
     empty_labels = []
 
@@ -25,7 +27,7 @@ def check_empty_labels():
     orphan_images = []
     existing_images = []
 
-    for label_stem in empty_labels[:10]:  # Kiểm tra 10 cái đầu
+    for label_stem in empty_labels[:limit]:  # Kiểm tra `limit` cái đầu
         found = False
         for ext in [".jpg", ".jpeg", ".png", ".JPG", ".JPEG", ".PNG"]:
             img_file = img_dir / (label_stem + ext)
@@ -37,7 +39,7 @@ def check_empty_labels():
         if not found:
             orphan_images.append(label_stem)
 
-    print(f"📊 Kiểm tra {len(empty_labels[:10])} empty labels:")
+    print(f"📊 Kiểm tra {len(empty_labels[:limit])} empty labels:")
     print(f"   ✅ Có ảnh tương ứng: {len(existing_images)}")
     print(f"   ❌ Không có ảnh:     {len(orphan_images)}")
 